@@ -1,7 +1,5 @@
 import os
 
-import boto3
-
 
 class Boto3Mixin:
 
@@ -49,6 +47,8 @@ class Boto3Mixin:
     @property
     def __session(self):
         if self.__session__ is None:
+            import boto3
+
             if self.__profile_name is not None:
                 try:
                     self.__session__ = boto3.Session(profile_name=self.__profile_name)
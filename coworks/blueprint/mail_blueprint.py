@@ -1,5 +1,7 @@
+import atexit
 import os
 import smtplib
+import threading
 import typing as t
 from email import message
 from email.utils import formataddr
@@ -55,6 +57,14 @@ class Mail(Blueprint):
         if not self.smtp_passwd:
             raise RuntimeError(f'{env_passwd_var_name} not defined in environment.')
 
+        # SMTP connection kept between sendings
+        self._smtp: smtplib.SMTP | None = None
+        self._smtp_starttls = False
+        self._smtp_lock = threading.Lock()
+
+        # the kept connection is closed when the lambda container is recycled
+        atexit.register(self._close_smtp)
+
     @entry
     def post_send(self, subject: str = "", from_addr: str | None = None, from_name: str = '',
                   reply_to: str | None = None, body: str = "", body_template: str | None = None, body_type="plain",
@@ -136,11 +146,20 @@ class Mail(Blueprint):
 
         # Send email
         try:
-            with smtplib.SMTP(self.smtp_server, port=self.smtp_port) as server:
-                if starttls:
-                    server.starttls()
-                server.login(self.smtp_login, self.smtp_passwd)
-                server.send_message(msg)
+            with self._smtp_lock:
+                smtp, kept = self._get_smtp(starttls)
+                try:
+                    smtp.send_message(msg)
+                except smtplib.SMTPSenderRefused as e:
+                    # the kept connection is closing (421 service not available) : nothing was accepted yet
+                    if not kept or e.smtp_code != 421:
+                        raise
+                    self._close_smtp()
+                    self._get_smtp(starttls)[0].send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # not sent again as the message may have been accepted before the disconnection
+                    self._close_smtp()
+                    raise
 
             resp = f"Mail sent to {msg['To']}"
             current_app.logger.info(resp)
@@ -149,3 +168,36 @@ class Mail(Blueprint):
             raise ConnectionError("Wrong username/password : cannot connect.")
         except Exception as e:
             raise InternalServerError(f"Cannot send email message (Error: {str(e)}).")
+
+    def _get_smtp(self, starttls: bool) -> tuple[smtplib.SMTP, bool]:
+        """Returns the logged SMTP connection (created only if needed or no more valid) and if it was kept."""
+        if self._smtp is not None and self._smtp_starttls == starttls:
+            # checks the kept connection (servers may answer 421 after an idle timeout)
+            try:
+                code, _ = self._smtp.noop()
+            except (smtplib.SMTPException, OSError):
+                code = None
+            if code != 250:
+                self._close_smtp()
+
+        kept = self._smtp is not None and self._smtp_starttls == starttls
+        if not kept:
+            self._close_smtp()
+            server = smtplib.SMTP(self.smtp_server, port=self.smtp_port)
+            try:
+                if starttls:
+                    server.starttls()
+                server.login(self.smtp_login, self.smtp_passwd)
+            except Exception:
+                server.close()
+                raise
+            self._smtp, self._smtp_starttls = server, starttls
+        return self._smtp, kept
+
+    def _close_smtp(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
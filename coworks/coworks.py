@@ -8,11 +8,9 @@ import sys
 import traceback
 import typing as t
 from functools import partial
-from functools import reduce
 from inspect import isfunction
 from pathlib import Path
 
-import boto3
 from flask import Blueprint as FlaskBlueprint
 from flask import Flask
 from flask import current_app
@@ -31,11 +29,12 @@ from .globals import request
 from .utils import BIZ_BUCKET_HEADER_KEY
 from .utils import BIZ_KEY_HEADER_KEY
 from .utils import HTTP_METHODS
+from .utils import PATH_TRANS
 from .utils import create_cws_proxy
 from .utils import get_app_stage
+from .utils import get_class_entries
 from .utils import get_cws_annotations
 from .utils import is_arg_parameter
-from .utils import is_kwarg_parameter
 from .utils import make_absolute
 from .utils import path_join
 from .utils import trim_underscores
@@ -276,7 +275,7 @@ class TechMicroService(Flask):
         if self.__aws_url_map is None:
             self.__aws_url_map = {}
             for rule in self.url_map.iter_rules():
-                entry_path = rule.rule.replace('<', '{').replace('>', '}')
+                entry_path = rule.rule.translate(PATH_TRANS)
                 if entry_path in self.__aws_url_map:
                     self.__aws_url_map[entry_path].append(rule)
                 else:
@@ -317,6 +316,8 @@ class TechMicroService(Flask):
         May be redefined for another storage in asynchronous call.
         """
 
+        import boto3
+
         bucket = key = ''
         try:
             bucket = request_headers.get(self.config['X-CWS-S3Bucket'].lower())
@@ -420,8 +421,7 @@ class TechMicroService(Flask):
             parts = ["Traceback (most recent call last):\n"]
             parts.extend(traceback.format_stack(limit=15)[:-2])
             parts.extend(traceback.format_exception(*sys.exc_info())[1:])
-            trace = reduce(lambda x, y: x + y, parts, "")
-            print(f"Traceback: {trace}")
+            print(f"Traceback: {''.join(parts)}")
             headers = {'content_type': "application/json"}
             return self._aws_payload(str(e), InternalServerError.code, headers)
 
@@ -493,12 +493,15 @@ class TechMicroService(Flask):
         }
 
     def full_logger_error(self, error):
+        # Formats the traceback only if it will be logged
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         self.logger.error(f"Exception in {self.name} : {error}")
         parts = ["Traceback (most recent call last):\n"]
         parts.extend(traceback.format_stack(limit=15)[:-2])
         parts.extend(traceback.format_exception(*sys.exc_info())[1:])
-        trace = reduce(lambda x, y: x + y, parts, "")
-        self.logger.error(f"Traceback: {trace}")
+        self.logger.error(f"Traceback: {''.join(parts)}")
 
     def add_coworks_routes(self, bp_state: BlueprintSetupState | None = None) -> None:
         """ Creates all routes for a microservice.
@@ -509,49 +512,56 @@ class TechMicroService(Flask):
         # Adds entrypoints
         stage = get_app_stage()
         scaffold = bp_state.blueprint if bp_state else self
-        method_members = inspect.getmembers(scaffold.__class__, lambda x: inspect.isfunction(x))
-        methods = [fun for _, fun in method_members if get_cws_annotations(fun, '__CWS_METHOD')]
-        for fun in methods:
+
+        # Already defined routes (rule, method) to detect duplicates
+        defined_routes = {(r.rule, m) for r in self.url_map.iter_rules() for m in r.methods or ()}
+
+        # Blueprint endpoint and url prefixes (the url prefix is normalized once for all entries)
+        endpoint_prefix = f"{bp_state.blueprint.name}." if bp_state else ''
+        url_prefix = make_absolute('', bp_state.url_prefix or '') if bp_state else '/'
+
+        # Entries are stored on the class at its first registration
+        scaffold_class: type = scaffold.__class__
+        for fun, cws_attributes in get_class_entries(scaffold_class):
 
             # the entry is not defined for this stage
-            stages = get_cws_annotations(fun, '__CWS_STAGES')
+            stages = cws_attributes['__CWS_STAGES']
             if stages and stage not in stages:
                 continue
 
-            method = get_cws_annotations(fun, '__CWS_METHOD')
-            entry_path = path_join(get_cws_annotations(fun, '__CWS_PATH'))
+            method = cws_attributes['__CWS_METHOD']
+            entry_path = path_join(cws_attributes['__CWS_PATH'])
 
-            # Get parameters
+            # Get parameters in one pass (skip self parameter)
             sig = inspect.signature(fun)
-            param_names = list(sig.parameters.keys())[1:]  # skip self parameter
+            args: list[str] = []
+            kwargs: dict[str, inspect.Parameter] = {}
+            annotations: dict[str, t.Any] = {}
             generic_kwargs = None
-            if len(param_names) > 0:
-                last_param_name = param_names[-1]
-                last_param = sig.parameters[param_names[-1]]
-                if last_param.kind == last_param.VAR_KEYWORD:
-                    generic_kwargs = last_param_name
-                    param_names = param_names[:-1]
-            args = [n for n in param_names if is_arg_parameter(sig.parameters[n])]
-            for index, arg in enumerate(args):
-                entry_path = path_join(entry_path, f"/<{arg}>")
-            kwargs = {n: sig.parameters[n] for n in param_names if is_kwarg_parameter(sig.parameters[n])}
-
-            proxy = create_cws_proxy(scaffold, fun, args, kwargs, generic_kwargs)
-            proxy.__CWS_BINARY_HEADERS = get_cws_annotations(fun, '__CWS_BINARY_HEADERS')
-            proxy.__CWS_NO_AUTH = get_cws_annotations(fun, '__CWS_NO_AUTH')
-            proxy.__CWS_NO_CORS = get_cws_annotations(fun, '__CWS_NO_CORS')
-            fun.__CWS_FROM_BLUEPRINT = bp_state.blueprint.name if bp_state else None
-
-            prefix = f"{bp_state.blueprint.name}." if bp_state else ''
-            endpoint = f"{prefix}{fun.__name__}"
-
-            # Creates the entry
-            url_prefix = bp_state.url_prefix if bp_state else None
-            rule = make_absolute(entry_path, url_prefix)
-            for r in self.url_map.iter_rules():
-                if r.rule == rule and method in (r.methods or []):
-                    raise AssertionError(f"Duplicate route {rule}")
+            for name, param in itertools.islice(sig.parameters.items(), 1, None):
+                annotations[name] = param.annotation
+                if param.kind is param.VAR_KEYWORD:
+                    generic_kwargs = name
+                elif is_arg_parameter(param):
+                    args.append(name)
+                else:
+                    kwargs[name] = param
+            if args:
+                entry_path = path_join(entry_path, *(f"<{arg}>" for arg in args))
+
+            proxy = create_cws_proxy(scaffold, fun, args, kwargs, generic_kwargs, annotations, method)
+            fun.__CWS_FROM_BLUEPRINT = bp_state.blueprint.name if bp_state else None  # type: ignore[attr-defined]
+
+            endpoint = f"{endpoint_prefix}{fun.__name__}"
+
+            # Creates the entry (the entry path is already normalized)
+            rule = f"{url_prefix.rstrip('/')}/{entry_path}" if entry_path else url_prefix
+            if (rule, method) in defined_routes:
+                raise AssertionError(f"Duplicate route {rule}")
             try:
                 self.add_url_rule(rule=rule, view_func=proxy, methods=[method], endpoint=endpoint, strict_slashes=False)
             except AssertionError:
                 raise
+
+            # Also registers the automatic methods (HEAD, OPTIONS) added with the rule
+            defined_routes.update((r.rule, m) for r in self.url_map.iter_rules(endpoint) for m in r.methods or ())
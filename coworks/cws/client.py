@@ -24,6 +24,9 @@ from .new import new_command
 from .utils import get_system_info
 from .utils import show_stage_banner
 
+# Uses the libyaml parser when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class CwsScriptInfo(ScriptInfo):
 
@@ -52,6 +55,10 @@ class CwsScriptInfo(ScriptInfo):
             os.chdir(old_dir)
 
     def load_app(self):
+        # The application is loaded only once, no need to change directory again
+        if self._loaded_app is not None:
+            return self._loaded_app
+
         with self.project_context():
             return super().load_app()
 
@@ -124,8 +131,17 @@ class CwsGroup(flask.cli.FlaskGroup):
         return ctx
 
 
+def show_version(ctx, param, value):
+    """Shows the version (the system information is only computed when asked)."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"{ctx.find_root().info_name} {__version__}, {get_system_info()}")
+    ctx.exit()
+
+
 @click.group(cls=CwsGroup)
-@click.version_option(version=__version__, message=f'%(prog)s %(version)s, {get_system_info()}')
+@click.option('--version', is_flag=True, expose_value=False, is_eager=True, callback=show_version,
+              help="Show the version and exit.")
 @click.option('-p', '--project-dir', default=DEFAULT_PROJECT_DIR,
               help=f"The project directory path (absolute or relative) [default to '{DEFAULT_PROJECT_DIR}'].")
 @click.option('-c', '--config-file', default='project', help="Configuration file path [relative from project dir].")
@@ -169,8 +185,8 @@ class ProjectConfig:
             project_dir_path = Path(dir)
             project_file = project_dir_path / (file_name + file_suffix)
             try:
-                project_file_content = Path(project_file).read_text()
-                return yaml.safe_load(project_file_content)
+                project_file_content = project_file.read_bytes()
+                return yaml.load(project_file_content, Loader=YamlLoader)
             except FileNotFoundError:
                 return {}
 
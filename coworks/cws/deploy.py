@@ -3,35 +3,41 @@ import hashlib
 import importlib
 import inspect
 import os
+import queue
+import re
 import subprocess
-import sys
 import sysconfig
 import tempfile
+import threading
+import time
 import typing as t
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from functools import cached_property
+from functools import lru_cache
 from functools import partial
 from pathlib import Path
 from shutil import ExecError
 from shutil import copyfile
 from shutil import copytree
 from shutil import ignore_patterns
-from shutil import make_archive
 from subprocess import CompletedProcess
 
-import boto3
 import click
 from flask.cli import pass_script_info
 from flask.cli import with_appcontext
 from jinja2 import BaseLoader
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import PackageLoader
 from jinja2 import select_autoescape
-from pydantic import BaseModel
-from pydantic import ConfigDict
 from werkzeug.routing import Rule
 
 from coworks import aws
+from coworks.utils import PATH_TRANS
 from coworks.utils import get_cws_annotations
 from coworks.utils import load_dotenv
 from .command import CwsCommand
@@ -40,6 +46,77 @@ from .utils import show_stage_banner
 from .utils import show_terraform_banner
 
 UID_SEP = '_'
+DEFAULT_AWS_REGION = 'eu-west-1'
+
+# Jinja environment shared by all terraform instances (templates are compiled once and never reloaded),
+# the compiled bytecode is also kept in the user's temporary cache folder between cws calls.
+JINJA_ENV = Environment(loader=PackageLoader(t.cast(str, __package__)), autoescape=select_autoescape(['html', 'xml']),
+                        trim_blocks=True, lstrip_blocks=True, auto_reload=False,
+                        bytecode_cache=FileSystemBytecodeCache(pattern='__coworks_%s.cache'))
+
+# Translation table to remove API Gateway path parameters braces
+UID_TRANS = str.maketrans('', '', '{}')
+
+# Terraform output line of a microservice API id (ms_name_id = "api_id")
+OUTPUT_ID_PATTERN = re.compile(r'^\s*(\S+?)_id\s*=\s*"([^"]+)"\s*$', re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def get_aws_session(profile_name: str):
+    """Returns the AWS session for this profile (configuration files are parsed only once)."""
+    import boto3
+
+    return boto3.Session(profile_name=profile_name)
+
+
+@lru_cache(maxsize=8)
+def get_aws_account(profile_name: str) -> str:
+    """Returns the AWS account for this profile (the STS request is done only once)."""
+    return get_aws_session(profile_name).client("sts").get_caller_identity()["Account"]
+
+
+@lru_cache(maxsize=1024)
+def short_uid(uid: str) -> str:
+    """Returns a short but stable uid (same value between runs so the generated files are reproducible)."""
+    return hashlib.blake2b(uid.encode(), digest_size=8).hexdigest()
+
+
+class Sha256Writer:
+    """Write only file wrapper computing the sha256 digest of the written bytes.
+    As it is not seekable, the zip members are written with data descriptors and never rewritten.
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+def make_zip_archive(archive_path: Path, sources_path: Path, compresslevel: int = 6) -> bytes:
+    """Creates the zip archive of the sources folder and returns its sha256 digest (computed while writing).
+    A 0 compression level stores the files without compression.
+    """
+    compression = zipfile.ZIP_DEFLATED if compresslevel else zipfile.ZIP_STORED
+    with archive_path.open('wb') as archive:
+        writer = Sha256Writer(archive)
+        with zipfile.ZipFile(t.cast(t.IO[bytes], writer), 'w', compression, compresslevel=compresslevel or None) as zf:
+            for root, dirnames, filenames in os.walk(sources_path):
+                dirnames.sort()
+                root_path = Path(root)
+                for name in dirnames:
+                    path = root_path / name
+                    zf.write(path, path.relative_to(sources_path))
+                for name in sorted(filenames):
+                    path = root_path / name
+                    if path.is_file():
+                        zf.write(path, path.relative_to(sources_path))
+    return writer.sha256.digest()
 
 
 class TerraformContext:
@@ -55,39 +132,92 @@ class TerraformContext:
             raise ModuleNotFoundError()
         self.app_import_path = info.app_import_path.replace(':', '.') if info.app_import_path else "app.app"
 
+    @cached_property
+    def api_resources(self):
+        """Returns the terraform resources indexed by uid (computed once for all terraform instances)."""
+        resources: dict[str, TerraformResource] = {}
+
+        # CoWorks annotations are fetched once per view function
+        view_annotations = {
+            endpoint: (get_cws_annotations(view_function, '__CWS_BINARY_HEADERS'),
+                       get_cws_annotations(view_function, '__CWS_NO_AUTH'),
+                       get_cws_annotations(view_function, '__CWS_NO_CORS'))
+            for endpoint, view_function in self.app.view_functions.items()
+        }
+
+        def add_rule(previous: str, path: str, rule_: Rule | None):
+            """Add a method rule in a resource."""
+            # todo : may use now aws_url_map
+            path = None if path is None else path.translate(PATH_TRANS)
+
+            # Creates terraform ressources if it doesn't exist.
+            resource = TerraformResource(parent_uid=previous, path=path)
+            resource = resources.setdefault(resource.uid, resource)
 
-class TerraformResource(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+            if rule_:
+                binary_headers, no_auth, no_cors = view_annotations.get(rule_.endpoint, (None, None, None))
+                setattr(rule_, 'cws_binary_headers', binary_headers)
+                setattr(rule_, 'cws_no_auth', no_auth)
+                setattr(rule_, 'cws_no_cors', no_cors)
+                resource.rules.append(rule_)
+            return resource.uid
+
+        for rule in self.app.url_map.iter_rules():
+            route = rule.rule
+            previous_uid = ''
+            if route.startswith('/'):
+                route = route[1:]
+            splited_route = route.split('/')
 
+            # special root case
+            if splited_route == ['']:
+                add_rule('', '', rule)
+                continue
+
+            # creates intermediate resources
+            for prev in splited_route[:-1]:
+                previous_uid = add_rule(previous_uid, prev, None)
+
+            # set entry keys for last entry
+            add_rule(previous_uid, splited_route[-1], rule)
+
+        return resources
+
+
+@dataclass(slots=True)
+class TerraformResource:
     parent_uid: str | None
     path: str | None
-    rules: list[Rule] | None = None
+    rules: list[Rule] = field(default_factory=list)
+    uid: str = field(init=False)
 
-    @cached_property
-    def uid(self) -> str:
+    def __post_init__(self) -> None:
+        self.uid = self._get_uid()
+
+    def _get_uid(self) -> str:
 
         if self.is_root:
             return ''
 
         assert self.path is not None, "TerraformResource Path cannot be None"
-        uid = self.path.replace('{', '').replace('}', '')
+        uid = self.path.translate(UID_TRANS)
 
         if self.parent_is_root:
             return uid
 
         # avoid too long id for ressources
-        parent_uid: str = self.parent_uid if len(self.parent_uid) < 80 else str(id(self.parent_uid))  # type: ignore
+        parent_uid: str = self.parent_uid if len(self.parent_uid) < 80 else short_uid(self.parent_uid)  # type: ignore
         return f"{parent_uid}{UID_SEP}{uid}" if self.path else parent_uid
 
-    @cached_property
+    @property
     def is_root(self) -> bool:
         return self.path is None
 
-    @cached_property
+    @property
     def parent_is_root(self) -> bool:
         return self.parent_uid == ''
 
-    @cached_property
+    @property
     def no_cors_methods(self) -> t.Iterator[set[str] | None]:
         if not self.rules:
             return iter(())
@@ -108,6 +238,8 @@ class Terraform:
         self.bar = backend.bar
         self.terraform_dir = terraform_dir
         self.refresh = backend.terraform_refresh
+        self.parallelism = backend.terraform_parallelism
+        self.aws_region = backend.aws_region
         self.stage = root_context.params['stage']
         self.workspace = workspace
         self.working_dir = Path(root_context.params.get('project_dir'))
@@ -118,7 +250,7 @@ class Terraform:
     def apply(self) -> None:
         """Executes terraform apply command."""
         try:
-            cmd = ['apply', '-auto-approve', '-parallelism=1']
+            cmd = ['apply', '-auto-approve', f'-parallelism={self.parallelism}']
             if not self.refresh:
                 cmd.append('-refresh=false')
             self._execute(cmd)
@@ -130,58 +262,12 @@ class Terraform:
             self._execute(cmd)
 
     def output(self):
-        values = self._execute(['output']).stdout
-        return values.decode("utf-8").strip()
+        return self._execute(['output']).stdout.strip()
 
     @property
     def api_resources(self):
         """Returns the list of flatten path (prev_uid, last, rule)."""
-        resources: dict[str, TerraformResource] = {}
-
-        def add_rule(previous: str, path: str, rule_: Rule | None):
-            """Add a method rule in a resource."""
-            # todo : may use now aws_url_map
-            path = None if path is None else path.replace('<', '{').replace('>', '}')
-            resource = TerraformResource(parent_uid=previous, path=path)
-            if rule_:
-                view_function = self.app_context.app.view_functions.get(rule_.endpoint)
-                setattr(rule_, 'cws_binary_headers', get_cws_annotations(view_function, '__CWS_BINARY_HEADERS'))
-                setattr(rule_, 'cws_no_auth', get_cws_annotations(view_function, '__CWS_NO_AUTH'))
-                setattr(rule_, 'cws_no_cors', get_cws_annotations(view_function, '__CWS_NO_CORS'))
-
-            # Creates terraform ressources if it doesn't exist.
-            uid = resource.uid
-            if uid not in resources:
-                resources[uid] = resource
-
-            resource = resources[uid]
-            if rule_:
-                if resources[uid].rules is None:
-                    resources[uid].rules = [rule_]
-                else:
-                    resources[uid].rules.append(rule_)  # type: ignore[union-attr]
-            return uid
-
-        for rule in self.app_context.app.url_map.iter_rules():
-            route = rule.rule
-            previous_uid = ''
-            if route.startswith('/'):
-                route = route[1:]
-            splited_route = route.split('/')
-
-            # special root case
-            if splited_route == ['']:
-                add_rule('', '', rule)
-                continue
-
-            # creates intermediate resources
-            for prev in splited_route[:-1]:
-                previous_uid = add_rule(previous_uid, prev, None)
-
-            # set entry keys for last entry
-            add_rule(previous_uid, splited_route[-1:][0], rule)
-
-        return resources
+        return self.app_context.api_resources
 
     @property
     def logger(self):
@@ -189,14 +275,14 @@ class Terraform:
 
     @property
     def template_loader(self) -> BaseLoader:
-        package_name = sys.modules[__name__].__package__
-        assert package_name is not None
-        return PackageLoader(package_name)
+        return t.cast(BaseLoader, JINJA_ENV.loader)
 
-    @property
+    @cached_property
     def jinja_env(self) -> Environment:
-        return Environment(loader=self.template_loader, autoescape=select_autoescape(['html', 'xml']),
-                           trim_blocks=True, lstrip_blocks=True)
+        """Shared environment, or an overlay of it if the template loader was redefined."""
+        if self.template_loader is JINJA_ENV.loader:
+            return JINJA_ENV
+        return JINJA_ENV.overlay(loader=self.template_loader)
 
     def get_context_data(self, **options) -> dict:
         # Microservice context data
@@ -214,37 +300,79 @@ class Terraform:
             'tf_key': tf_key,
             'stage': self.stage,
             'workspace': self.workspace,
-            **options
         }
+        data.update(options)
 
         # AWS context data
         profile_name = options.get('profile_name')
         if profile_name:
-            aws_session = boto3.Session(profile_name=profile_name)
-            aws_region = aws_session.region_name
-            data['aws_region'] = aws_region
-            aws_account = aws_session.client("sts").get_caller_identity()["Account"]
-            data['aws_account'] = aws_account
+            data['aws_region'] = get_aws_session(profile_name).region_name
+            data['aws_account'] = get_aws_account(profile_name)
 
         return data
 
     def _execute(self, cmd_args: list[str]) -> CompletedProcess:
         self.logger.debug(f"Terraform arguments : ['-chdir={self.terraform_dir} {' '.join(cmd_args)}]")
-        p = subprocess.run(["terraform", *cmd_args], capture_output=True, cwd=self.terraform_dir,
-                           timeout=self.TIMEOUT)
+
+        # Streams standard output (stderr is kept in a temporary file to avoid pipe deadlock)
+        stdout: list[str] = []
+        lines: queue.Queue[str | None] = queue.Queue()
+        deadline = time.monotonic() + self.TIMEOUT
+
+        def read_stdout(pipe):
+            for line in pipe:
+                lines.put(line)
+            lines.put(None)
+
+        def remaining():
+            return max(deadline - time.monotonic(), 0)
+
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as stderr_file:
+            process = subprocess.Popen(["terraform", *cmd_args], stdout=subprocess.PIPE, stderr=stderr_file,
+                                       cwd=self.terraform_dir, bufsize=1 << 16, encoding='utf-8')
+
+            # Output is read in a thread so the timeout is enforced even if the process stops writing,
+            # the lines are consumed here as the progress bar must only be updated from the main thread
+            reader = threading.Thread(target=read_stdout, args=(process.stdout,), daemon=True)
+            reader.start()
+            try:
+                try:
+                    while (line := lines.get(timeout=remaining())) is not None:
+                        stdout.append(line)
+                        self.logger.debug(line.rstrip())
+                        if self.bar:
+                            self.bar.advance()
+                    returncode = process.wait(timeout=remaining())
+                except queue.Empty:
+                    raise subprocess.TimeoutExpired(process.args, self.TIMEOUT)
+            except BaseException as e:
+                process.kill()
+                process.wait()
+                if isinstance(e, subprocess.TimeoutExpired):
+                    stderr_file.seek(0)
+                    raise subprocess.TimeoutExpired(process.args, self.TIMEOUT, output=''.join(stdout),
+                                                    stderr=stderr_file.read())
+                raise
+            reader.join()
+            assert process.stdout is not None
+            process.stdout.close()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+
+        p = CompletedProcess(process.args, returncode, ''.join(stdout), stderr)
         if p.returncode != 0:
-            msg = p.stderr.decode('utf-8')
-            if not msg:
-                msg = p.stdout.decode('utf-8')
-            raise ExecError(msg)
+            raise ExecError(p.stderr or p.stdout)
         return p
 
     def generate_file(self, template_filename, output_filename, **options) -> None:
         """Generates stage terraform files."""
+        self.generate_file_with_data(template_filename, output_filename, self.get_context_data(**options))
+
+    def generate_file_with_data(self, template_filename, output_filename, data: dict) -> None:
+        """Generates stage terraform files from an already computed context data."""
         template = self.jinja_env.get_template(template_filename)
-        with (self.terraform_dir / output_filename).open("w") as f:
-            data = self.get_context_data(**options)
-            f.write(template.render(**data))
+        with (self.terraform_dir / output_filename).open("w", buffering=1 << 20) as f:
+            template.stream(**data).dump(f)
             self.logger.debug(f"Terraform file {self.terraform_dir / output_filename} generated")
 
 
@@ -264,6 +392,10 @@ class TerraformBackend:
 
         self.terraform_class = Terraform
         self.terraform_refresh = options['terraform_refresh']
+        self.terraform_parallelism = options.get('terraform_parallelism', 1)
+        profile_name = options.get('profile_name')
+        aws_region = get_aws_session(profile_name).region_name if profile_name else None
+        self.aws_region = aws_region or DEFAULT_AWS_REGION
         self._api_terraform = self._stage_terraform = None
 
     @property
@@ -289,36 +421,46 @@ class TerraformBackend:
         # Set default options calculated value
         options['key'] = options.get('key') or f"{self.app.name}/archive.zip"
 
-        # Transfert zip file to S3
+        # Transfert zip file to S3 (uploaded while terraform files are generated and initialized)
         self.bar.update(msg="Copy source files on S3")
-        b64sha256 = self.copy_sources_to_s3(**options)
-        options['source_code_hash'] = b64sha256
-
-        self.bar.update(msg="Generates terraform files")
-
-        # Generates common terraform files
-        if terraform_init:
-            output_filename = "terraform.tf"
-            self.app.logger.debug('Generate terraform global files')
-            self.api_terraform.generate_file("terraform.j2", output_filename, **root_command_params, **options)
-            self.stage_terraform.generate_file("terraform.j2", output_filename, **root_command_params, **options)
-
-        # Generates terraform files and copy environment variable files in terraform working dir for provisionning
-        output_filename = f"{self.app.name}.tech.tf"
-        self.app.logger.debug(f'Generate terraform {output_filename} files')
-        self.api_terraform.generate_file(command_template, output_filename, **root_command_params, **options)
-        self.stage_terraform.generate_file(command_template, output_filename, **root_command_params, **options)
-
-        # Stops process if dry
-        if options['dry']:
-            self.bar.update(msg="Nothing deployed and destroyed (dry mode)")
-            return
-
-        if terraform_init:
-            self.app.logger.debug("Init terraform")
-            self.api_terraform.init()
-            assert self._stage_terraform is not None
-            self._stage_terraform.init()
+        with tempfile.TemporaryDirectory() as tmp_dir, ThreadPoolExecutor(max_workers=1) as executor:
+            module_archive, b64sha256 = self.archive_sources(Path(tmp_dir), **options)
+            options['source_code_hash'] = b64sha256
+            upload = executor.submit(self.copy_sources_to_s3, module_archive, **options)
+
+            self.bar.update(msg="Generates terraform files")
+
+            # Context data is computed once, only the workspace differs between the api and stage terraform
+            api_data = self.api_terraform.get_context_data(**root_command_params, **options)
+            stage_data = {**api_data, 'workspace': self.stage_terraform.workspace}
+
+            # Generates common terraform files
+            if terraform_init:
+                output_filename = "terraform.tf"
+                self.app.logger.debug('Generate terraform global files')
+                self.api_terraform.generate_file_with_data("terraform.j2", output_filename, api_data)
+                self.stage_terraform.generate_file_with_data("terraform.j2", output_filename, stage_data)
+
+            # Generates terraform files and copy environment variable files in terraform working dir for provisionning
+            output_filename = f"{self.app.name}.tech.tf"
+            self.app.logger.debug(f'Generate terraform {output_filename} files')
+            self.api_terraform.generate_file_with_data(command_template, output_filename, api_data)
+            self.stage_terraform.generate_file_with_data(command_template, output_filename, stage_data)
+
+            # Stops process if dry
+            if options['dry']:
+                self.bar.update(msg=upload.result())
+                self.bar.update(msg="Nothing deployed and destroyed (dry mode)")
+                return
+
+            # Terraform folders are initialized one after the other (the plugin cache is not concurrent safe)
+            if terraform_init:
+                self.app.logger.debug("Init terraform")
+                self.api_terraform.init()
+                self.stage_terraform.init()
+
+            # Sources must be on S3 before applying (the bar is only updated from the main thread)
+            self.bar.update(msg=upload.result())
 
         # Apply to api terraform
         self.bar.update(msg="Create or update API")
@@ -338,69 +480,69 @@ class TerraformBackend:
         echo_output(self.api_terraform)
         click.secho("🎉 CoWorks Microservice deployed", fg="green")
 
-    def copy_sources_to_s3(self, dry, **options):
+    def archive_sources(self, tmp_path: Path, **options) -> tuple[Path, str]:
+        """Creates the sources archive in the temporary folder and returns it with its base64 sha256."""
         module_name = options.get('module_name') or []
+
+        # Defines ignore file paternsctx
+        ignore = options.get('ignore') or ['.*', 'terraform*']
+        if ignore and not isinstance(ignore, list):
+            if type(ignore) is tuple:
+                ignore = [*ignore]
+            else:
+                ignore = [ignore]
+        ignore = [*ignore, '*.pyc', '__pycache__']
+        ignore = [*ignore, 'Pipfile*', 'requirements.txt']
+        ignore = [*ignore, '*cws.yml', 'env_variables*']
+        full_ignore_patterns = partial(ignore_patterns, *ignore)
+
+        # Creates archive
+        project_dir = self.terraform_context.ctx.find_root().params.get('project_dir')
+        full_project_dir = Path(project_dir).resolve()
+        try:
+            if tmp_path.relative_to(full_project_dir):
+                msg = f"Cannot deploy a project defined in tmp folder (project dir id {full_project_dir})"
+                raise click.exceptions.UsageError(msg)
+        except (Exception,):
+            pass
+
+        tmp_sources_path = Path(tmp_path) / 'filtered_dir'
+        self.app.logger.debug(f"Copy source file in {tmp_sources_path}")
+        copytree(project_dir, tmp_sources_path, ignore=full_ignore_patterns())
+
+        for name in module_name:
+            if name.endswith(".py"):
+                file_path = Path(sysconfig.get_path('purelib')) / name
+                copyfile(file_path, tmp_sources_path / name)
+            else:
+                mod = importlib.import_module(name)
+                assert mod.__file__ is not None
+                module_path = Path(mod.__file__).resolve().parent
+                copytree(module_path, tmp_sources_path / name, ignore=full_ignore_patterns())
+        module_archive = tmp_path / 'sources.zip'
+        digest = make_zip_archive(module_archive, tmp_sources_path, options.get('zip_level', 6))
+        b64sha256 = base64.b64encode(digest).decode()
+        return module_archive, b64sha256
+
+    def copy_sources_to_s3(self, module_archive: Path, dry, **options) -> str:
+        """Uploads the sources archive and returns the progress message (may be called in a worker thread)."""
         bucket = options.get('bucket')
         key = options.get('key')
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-
-            # Defines ignore file paternsctx
-            ignore = options.get('ignore') or ['.*', 'terraform*']
-            if ignore and not isinstance(ignore, list):
-                if type(ignore) is tuple:
-                    ignore = [*ignore]
-                else:
-                    ignore = [ignore]
-            ignore = [*ignore, '*.pyc', '__pycache__']
-            ignore = [*ignore, 'Pipfile*', 'requirements.txt']
-            ignore = [*ignore, '*cws.yml', 'env_variables*']
-            full_ignore_patterns = partial(ignore_patterns, *ignore)
-
-            # Creates archive
-            project_dir = self.terraform_context.ctx.find_root().params.get('project_dir')
-            full_project_dir = Path(project_dir).resolve()
-            try:
-                if tmp_path.relative_to(full_project_dir):
-                    msg = f"Cannot deploy a project defined in tmp folder (project dir id {full_project_dir})"
-                    raise click.exceptions.UsageError(msg)
-            except (Exception,):
-                pass
-
-            tmp_sources_path = Path(tmp_path) / 'filtered_dir'
-            self.app.logger.debug(f"Copy source file in {tmp_sources_path}")
-            copytree(project_dir, tmp_sources_path, ignore=full_ignore_patterns())
-
-            for name in module_name:
-                if name.endswith(".py"):
-                    file_path = Path(sysconfig.get_path('purelib')) / name
-                    copyfile(file_path, tmp_sources_path / name)
-                else:
-                    mod = importlib.import_module(name)
-                    assert mod.__file__ is not None
-                    module_path = Path(mod.__file__).resolve().parent
-                    copytree(module_path, tmp_sources_path / name, ignore=full_ignore_patterns())
-            module_archive = make_archive(str(tmp_path / 'sources'), 'zip', tmp_sources_path)
-
-            # Uploads archive on S3
-            with open(module_archive, 'rb') as archive:
-                size = int(os.path.getsize(module_archive) / 1000)
-                b64sha256 = base64.b64encode(hashlib.sha256(archive.read()).digest()).decode()
-                if dry:
-                    self.bar.update(msg=f"Nothing copied (dry mode, {size} Kb)")
-                else:
-                    archive.seek(0)
-                    try:
-                        profile_name = options.get('profile_name')
-                        aws_s3_session = aws.AwsS3Session(profile_name=profile_name)
-                        aws_s3_session.client.upload_fileobj(archive, bucket, key)
-                    except Exception as e:
-                        raise e
-
-                    self.app.logger.debug(msg=f"Successfully uploaded sources at s3://{bucket}/{key}")
-                    self.bar.update(msg=f"Sources files copied ({size} Kb)")
-
-            return b64sha256
+        with module_archive.open('rb', buffering=1 << 23) as archive:
+            size = int(os.path.getsize(module_archive) / 1000)
+            if dry:
+                return f"Nothing copied (dry mode, {size} Kb)"
+
+            from boto3.s3.transfer import TransferConfig
+
+            # Large archives are uploaded in parallel parts
+            config = TransferConfig(multipart_threshold=1 << 23, multipart_chunksize=1 << 23, max_concurrency=10)
+            profile_name = options.get('profile_name')
+            aws_s3_session = aws.AwsS3Session(profile_name=profile_name)
+            aws_s3_session.client.upload_fileobj(archive, bucket, key, Config=config)
+
+            self.app.logger.debug(msg=f"Successfully uploaded sources at s3://{bucket}/{key}")
+            return f"Sources files copied ({size} Kb)"
 
     def delete_sources_on_s3(self, **options):
         bucket = options.get('bucket')
@@ -448,6 +590,8 @@ class TerraformBackend:
               help="Terraform files folder (default terraform).")
 @click.option('--terraform-organization', '-to',
               help="Terraform organization (needed if using cloud terraform).")
+@click.option('--terraform-parallelism', default=1,
+              help="Number of concurrent terraform operations when applying (default 1).")
 @click.option('--terraform-refresh', '-tr', is_flag=True, default=True,
               help="Forces terraform to refresh the state (default true).")
 @click.option('--text-types', multiple=True,
@@ -456,6 +600,8 @@ class TerraformBackend:
               help="Lambda timeout (default 60s).Only for asynchronous call (API call 30s).")
 @click.option('--token-key',
               help="Header token key.")
+@click.option('--zip-level', type=click.IntRange(0, 9), default=6,
+              help="Sources zip compression level, 0 for no compression (default 6).")
 @click.pass_context
 @pass_script_info
 @with_appcontext
@@ -501,6 +647,8 @@ def deploy_command(info, ctx, **options) -> None:
               help="Terraform files folder (default terraform).")
 @click.option('--terraform-organization', '-to',
               help="Terraform organization needed if using cloud terraform.")
+@click.option('--terraform-parallelism', default=1,
+              help="Number of concurrent terraform operations when applying (default 1).")
 @click.option('--terraform-refresh', '-tr', is_flag=True, default=True,
               help="Forces terraform to refresh the state (default true).")
 @click.pass_context
@@ -528,6 +676,8 @@ def destroy_command(info, ctx, **options) -> None:
 
 
 @click.command("deployed", CwsCommand, short_help="Retrieve the microservices deployed for this project.")
+@click.option('--profile-name', '-pn',
+              help=f"AWS credential profile used to get the region (default region {DEFAULT_AWS_REGION}).")
 @click.option('--terraform-dir', default="terraform",
               help="Terraform folder (default terraform).")
 @click.option('--terraform-cloud', is_flag=True, default=False,
@@ -557,11 +707,6 @@ def deployed_command(info, ctx, **options) -> None:
 def echo_output(terraform):
     """Pretty print terraform output.
     """
-    rows = terraform.output()
-    for row in rows.split('\n'):
-        values = row.split('=')
-        if len(values) > 1:
-            cws_name = values[0].strip()[:-3]  # remove last _id
-            api_id = values[1].strip()[1:-1]  # remove quotes
-            api_url = f"https://{api_id}.execute-api.eu-west-1.amazonaws.com/"
-            click.secho(f"The microservice {cws_name} is deployed at {api_url}", fg='yellow')
+    for cws_name, api_id in OUTPUT_ID_PATTERN.findall(terraform.output()):
+        api_url = f"https://{api_id}.execute-api.{terraform.aws_region}.amazonaws.com/"
+        click.secho(f"The microservice {cws_name} is deployed at {api_url}", fg='yellow')
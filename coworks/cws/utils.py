@@ -2,14 +2,18 @@ import platform
 import sys
 import typing as t
 from contextlib import contextmanager
+from functools import lru_cache
 from importlib.metadata import version
-from threading import Thread
-from time import sleep
 
 import click
 
+# Number of steps of the progress bar not used by the command output
+ADVANCE_RESERVED_STEPS = 20
 
+
+@lru_cache(maxsize=1)
 def get_system_info():
+    """Returns the flask, python and platform versions (computed once as it doesn't change while running)."""
     flask_version = version("flask")
 
     flask_info = f"flask {flask_version}"
@@ -33,7 +37,6 @@ class ProgressBar:
     def __init__(self, bar):
         self.bar = bar
         self.stop = False
-        self.spin_thread = None
 
     def echo(self, msg):
         swap = self.bar.format_progress_line
@@ -47,10 +50,13 @@ class ProgressBar:
             self.echo(msg)
         self.bar.update(1)
 
+    def advance(self):
+        """Advances the bar on command output, keeping the last steps for the progress messages."""
+        if self.bar.pos < self.bar.length - ADVANCE_RESERVED_STEPS:
+            self.bar.update(1)
+
     def terminate(self, msg: str | None = None):
         self.stop = True
-        if self.spin_thread:
-            self.spin_thread.join()
         self.bar.finish()
         self.bar.render_progress()
         if msg:
@@ -58,10 +64,13 @@ class ProgressBar:
 
 
 class DebugProgressBar:
-    def update(self, msg: str):
+    def update(self, msg: str | None = None):
         if msg:
             click.echo("==> " + msg)
 
+    def advance(self):
+        pass
+
     def echo(self, msg: str):
         if msg:
             click.echo("==> " + msg)
@@ -69,23 +78,14 @@ class DebugProgressBar:
 
 @contextmanager  # type: ignore[arg-type]
 def progressbar(length=200, *, label: str, threaded: bool = False) -> t.ContextManager[ProgressBar]:  # type: ignore
-    """Spinner progress bar.
-    Creates it with a task label and updates it with progress messages using the 'update' function.
+    """Progress bar.
+    Creates it with a task label and updates it with progress messages using the 'update' function
+    (the terraform commands advance it on each output line, but not up to the end).
     """
     if threaded:
         try:
             with click.progressbar(range(length - 1), label=label.ljust(40), show_eta=False) as bar:
                 pb = ProgressBar(bar)
-
-                def display_spinning_cursor():
-                    while not pb.stop:
-                        sleep(1)
-                        if not pb.stop:
-                            pb.update()
-
-                spin_thread = Thread(target=display_spinning_cursor)
-                spin_thread.start()
-                pb.spin_thread = spin_thread
                 yield pb
                 if not pb.stop:
                     pb.terminate()
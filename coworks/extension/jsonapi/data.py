@@ -1,4 +1,5 @@
 import typing as t
+from functools import cached_property
 from math import ceil
 
 from pydantic import BaseModel
@@ -97,18 +98,19 @@ class JsonApiBaseModel(BaseModel, JsonApiDataMixin):
     def jsonapi_attributes(self, context: "FetchingContext", with_relationships: list[str] | None = None) \
             -> tuple[dict[str, t.Any], dict[str, 'JsonApiRelationship']]:
         fields = context.field_names(self.jsonapi_type)
-        attrs = {k: v for k, v in self.model_dump().items() if (not fields or k in fields)}  # type:ignore
+        # only the requested fields are serialized
+        attrs = self.model_dump(include=fields or None)
         return attrs, {}
 
 
 class JsonApiDict(dict, JsonApiDataMixin):
-    """Dict data for JSON:API resource"""
+    """Dict data for JSON:API resource (type and id are read once)"""
 
-    @property
+    @cached_property
     def jsonapi_type(self) -> str:
         return self['type']
 
-    @property
+    @cached_property
     def jsonapi_id(self) -> str:
         return str(self['id'])
 
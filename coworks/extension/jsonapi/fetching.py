@@ -30,6 +30,7 @@ class FetchingContext:
                  page__number__: int | None = None, page__size__: int | None = None, page__max__: int | None = None):
         self.include = list(map(str.strip, include.split(','))) if include else []
         self._fields = fields__ if fields__ is not None else {}
+        self._field_names: dict[str, frozenset[str]] = {}
         self._sort = list(map(str.strip, sort.split(','))) if sort else []
         self.page = page__number__ or 1
         self.per_page = page__size__ or 100
@@ -48,10 +49,15 @@ class FetchingContext:
 
         self.connection_manager = contextlib.nullcontext()
 
-    def field_names(self, jsonapi_type) -> list[str]:
-        """Returns the field's names that must be returned for a specific jsonapi type."""
+    def field_names(self, jsonapi_type) -> frozenset[str]:
+        """Returns the field's names that must be returned for a specific jsonapi type (parsed once per type)."""
+        if jsonapi_type not in self._field_names:
+            self._field_names[jsonapi_type] = self._parse_field_names(jsonapi_type)
+        return self._field_names[jsonapi_type]
+
+    def _parse_field_names(self, jsonapi_type) -> frozenset[str]:
         if jsonapi_type not in self._fields:
-            return []
+            return frozenset()
 
         fields = self._fields[jsonapi_type]
         if isinstance(fields, list):
@@ -61,7 +67,7 @@ class FetchingContext:
             field = fields[0]
         else:
             field = fields
-        return list(map(str.strip, field.split(',')))
+        return frozenset(map(str.strip, field.split(',')))
 
     def pydantic_filters(self, base_model: JsonApiBaseModel):
         _base_model_filters: list[bool] = []
@@ -29,6 +29,8 @@ from .fetching import fetching_context
 from .query import Pagination
 from .query import Query
 
+JSONAPI_MIMETYPE = 'application/vnd.api+json'
+
 
 class JsonApiError(Exception):
     """Exception wich will create a JSON:API error."""
@@ -76,7 +78,7 @@ class JsonApi:
         handle_user_exception = app.handle_user_exception
 
         def _handle_user_exception(e):
-            if 'application/vnd.api+json' not in request.headers.getlist('accept'):
+            if JSONAPI_MIMETYPE not in request.headers.getlist('accept'):
                 return handle_user_exception(e)
 
             if isinstance(e, ValidationError):
@@ -105,10 +107,10 @@ class JsonApi:
         app.after_request(self._change_content_type)
 
     def _change_content_type(self, response):
-        if 'application/vnd.api+json' not in request.headers.getlist('accept'):
+        if JSONAPI_MIMETYPE not in request.headers.getlist('accept'):
             return response
 
-        response.content_type = 'application/vnd.api+json'
+        response.content_type = JSONAPI_MIMETYPE
         return response
 
     def _toplevel_error_response(self, errors, *, status_code=None):
@@ -116,7 +118,7 @@ class JsonApi:
         if status_code is None:
             status_code = max((err.status for err in errors))
         response = make_response(toplevel, status_code)
-        response.content_type = 'application/vnd.api+json'
+        response.content_type = JSONAPI_MIMETYPE
         return response
 
 
@@ -195,7 +197,6 @@ def to_ressource_data(jsonapi_data: JsonApiDataMixin, *,
     """
 
     # set resource data from basemodel
-    _type = jsonapi_data.jsonapi_type
     attrs, rels = jsonapi_data.jsonapi_attributes(fetching_context, with_relationships)
     if 'type' in attrs:
         _type = attrs.pop('type')
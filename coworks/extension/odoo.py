@@ -1,4 +1,5 @@
 import os
+import threading
 import typing as t
 import xmlrpc.client
 
@@ -122,6 +123,9 @@ class Odoo:
         GraphQL removed.
     """
 
+    # Timeout (in seconds) of the JSON-RPC requests to not block the lambda on a hung server
+    TIMEOUT = 60
+
     def __init__(self, app: TechMicroService | None = None,
                  config: OdooConfig | None = None, binds: dict[str | None, OdooConfig] | None = None):
 
@@ -134,6 +138,13 @@ class Odoo:
         self.app = None
 
         self.binds = binds if binds else {}
+
+        # Connections are kept per thread as XML-RPC proxies (and HTTP sessions) are not thread safe
+        self._local = threading.local()
+
+        # JSON-RPC may be used instead of XML-RPC (lighter payloads on a persistent HTTP session)
+        self.jsonrpc = os.getenv('ODOO_TRANSPORT') == 'jsonrpc'
+
         if config:
             self.binds[None] = config
 
@@ -204,6 +215,20 @@ class Odoo:
 
         return {"ids": [rec['id'] for rec in res], "values": res}
 
+    @XRay.capture(xray_recorder)
+    def get_models(self, model: str, field: str, values: t.Iterable, *, fields: list[str] | None = None,
+                   bind_key: str | None = None) -> list[dict]:
+        """Reads in one request all the records having the field value in the list of values.
+
+        @param model: python as a dot separated class name.
+        @param field: field name searched.
+        @param values: values searched.
+        @param fields: record fields for result.
+        @param bind_key: bind configuration to be used.
+        """
+        params = {'fields': fields} if fields else {}
+        return self.odoo_execute_kw(model, "search_read", [[(field, 'in', list(values))]], params, bind_key=bind_key)
+
     @XRay.capture(xray_recorder)
     def create(self, model: str, data: list[dict] | None = None, bind_key: str | None = None) -> int:
         """Creates new records for the model.
@@ -259,6 +284,16 @@ class Odoo:
         """
         config = self.binds[bind_key]
 
+        if self.jsonrpc:
+            if '__uid' not in config.const:
+                connected_uid = self._jsonrpc(config, 'common', 'authenticate',
+                                              config.dbname, config.user, config.passwd, {})
+                if not connected_uid:
+                    raise ConnectionError()
+                config.const['__uid'] = connected_uid
+            return self._jsonrpc(config, 'object', 'execute_kw',
+                                 config.dbname, config.const['__uid'], config.passwd, model, method, *args)
+
         if '__uid' not in config.const:
             common = xmlrpc.client.ServerProxy(f'{config.url}/xmlrpc/2/common')
             connected_uid = common.authenticate(config.dbname, config.user, config.passwd, {})
@@ -266,5 +301,31 @@ class Odoo:
                 raise ConnectionError()
             config.const['__uid'] = connected_uid
 
-        models = xmlrpc.client.ServerProxy(f'{config.url}/xmlrpc/2/object')
+        # The proxy is kept per bind (and thread) as its transport reuses the HTTP connection
+        if not hasattr(self._local, 'models'):
+            self._local.models = {}
+        models = self._local.models.get(bind_key)
+        if models is None:
+            models = self._local.models[bind_key] = xmlrpc.client.ServerProxy(f'{config.url}/xmlrpc/2/object')
         return models.execute_kw(config.dbname, config.const['__uid'], config.passwd, model, method, *args, **kwargs)
+
+    def _jsonrpc(self, config: OdooConfig, service: str, method: str, *args):
+        """Calls a service method with the JSON-RPC external API.
+        Errors are raised as XML-RPC faults to be independent of the transport.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+
+        payload: dict[str, t.Any] = {
+            'jsonrpc': "2.0",
+            'method': "call",
+            'params': {'service': service, 'method': method, 'args': list(args)},
+        }
+        resp = session.post(f'{config.url}/jsonrpc', json=payload, timeout=self.TIMEOUT)
+        resp.raise_for_status()
+        result = resp.json()
+        if 'error' in result:
+            error = result['error']
+            raise xmlrpc.client.Fault(error.get('code', 0), error.get('data', {}).get('message', error.get('message')))
+        return result['result']
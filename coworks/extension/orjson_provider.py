@@ -0,0 +1,59 @@
+import typing as t
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+if t.TYPE_CHECKING:
+    from flask import Flask
+
+# Dates and dataclasses are passed to the default function to keep the flask serialization
+DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider using orjson for serialization and deserialization.
+
+    The serialized values are the same as the flask default provider (dates, decimals, uuids, dataclasses), but
+    the output differs:
+
+    - keys are kept in insertion order (``sort_keys`` is ``False``, set it to ``True`` to sort them),
+    - non ASCII characters are emitted as is in UTF-8 (``ensure_ascii`` is ``False``),
+    - non string keys are converted to strings.
+
+    Falls back to the flask default provider when ``ensure_ascii`` is set, for ``json.dumps`` specific keyword
+    arguments, or for values orjson cannot serialize (such as integers wider than 64 bits).
+    Values unsupported by both providers raise a ``TypeError``.
+    """
+
+    ensure_ascii = False
+    sort_keys = False
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        if self.ensure_ascii or kwargs.keys() - {'indent', 'separators'}:
+            return super().dumps(obj, **kwargs)
+
+        option = DUMPS_OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+class Orjson:
+    """Extension replacing the application JSON provider by the orjson one."""
+
+    def __init__(self, app: t.Optional["Flask"] = None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: "Flask"):
+        app.json = OrjsonProvider(app)
@@ -7,7 +7,7 @@ from functools import update_wrapper
 from inspect import Parameter
 from inspect import Signature
 from inspect import signature
-from pathlib import PurePosixPath
+from pathlib import Path
 from urllib.parse import parse_qs
 from urllib.parse import urlencode
 from urllib.parse import urlsplit as urllib_urlsplit
@@ -27,6 +27,8 @@ if t.TYPE_CHECKING:
     from flask.sansio.scaffold import Scaffold
 
 HTTP_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS']
+BODY_METHODS = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
+TRUE_VALUES = frozenset(('true', '1', 'yes'))
 
 PROJECT_CONFIG_VERSION = 3
 
@@ -37,12 +39,19 @@ DEFAULT_PROJECT_DIR = "tech"
 BIZ_BUCKET_HEADER_KEY: str = 'X-CWS-S3Bucket'
 BIZ_KEY_HEADER_KEY: str = 'X-CWS-S3Key'
 
+# Class attribute storing the entries of a microservice class
+CWS_ENTRIES_ATTRIBUTE = '_cws_entries'
+
+# Translation table from flask path parameters to API Gateway ones
+PATH_TRANS = str.maketrans('<>', '{}')
+
 OPEN_SQUARE_BRACKETED_KWARG_PATTERN = re.compile(r'([a-zA-Z0-9]+)__')
 SQUARE_BRACKETED_KWARG_PATTERN = re.compile(r'([a-zA-Z0-9]+)__([a-zA-Z0-9._]+)__')
 
 
 def create_cws_proxy(scaffold: "Scaffold", func, func_args: list[str], func_kwargs: dict,
-                     func_generic_kwargs: str | None):
+                     func_generic_kwargs: str | None, annotations: dict[str, t.Any] | None = None,
+                     method: str | None = None):
     """Creates the AWS Lambda proxy function.
 
     :param scaffold: The Flask or Blueprint object.
@@ -50,7 +59,82 @@ def create_cws_proxy(scaffold: "Scaffold", func, func_args: list[str], func_kwar
     :param func_args: The declared function args.
     :param func_kwargs: The declared function kwargs.
     :param func_generic_kwargs: The function generic kwargs if defined (usually **kwargs).
+    :param annotations: The function parameters annotations (computed from signature if not given).
+    :param method: The route HTTP method (the extractor is selected on each request if not given).
     """
+    if annotations is None:
+        annotations = get_annotations(func)
+    casters = get_value_casters(annotations)
+    binary_headers = get_cws_annotations(func, "__CWS_BINARY_HEADERS")
+
+    # Unexpected parameters are only checked if no generic kwargs are defined
+    expected_kwargs = frozenset(func_kwargs) if func_kwargs and not func_generic_kwargs else None
+
+    def as_fun_params(values: t.Iterable[tuple[str, t.Any]], params: dict[str, t.Any], flat=True, replace=True):
+        """Set parameters as simple value or list of values if multiple defined.
+       :param values: Iterable of (key, value) pairs (dict items or multidict lists).
+       :param params: The parameters dict updated in place.
+       :param flat: If true, the list values of lenth 1 is return as single value.
+       :param replace: If false, a value cannot replace a path parameter.
+        """
+        for k, v in values:
+            k = remove_brackets(k)
+
+            # if the parameter is a sparse fieldsets
+            if splitted := SQUARE_BRACKETED_KWARG_PATTERN.fullmatch(k):
+                for kwarg in func_kwargs:
+                    if k.startswith(kwarg) and OPEN_SQUARE_BRACKETED_KWARG_PATTERN.fullmatch(kwarg):
+                        k = kwarg
+                        if k in params:
+                            v = {**params[k], **{splitted.group(2): v}}
+                        else:
+                            v = {splitted.group(2): v}
+                        break
+
+            # Alerts when more parameters than expected are defined in request
+            if expected_kwargs is not None and k not in expected_kwargs:
+                _err_msg = f"TypeError: got an unexpected keyword argument '{k}'"
+                raise UnprocessableEntity(_err_msg)
+
+            if not replace and k in func_args:
+                raise TypeError(f"got multiple values for keyword argument '{k}'")
+
+            # Flatten single value
+            params[k] = v[0] if flat and isinstance(v, list) and len(v) == 1 else v
+
+        return params
+
+    def from_query(req, view_args):
+        """Adds parameters from query parameters."""
+        return as_fun_params(req.values.lists(), view_args, replace=False)
+
+    def from_body(req, view_args):
+        """Adds parameters from body."""
+        try:
+            if req.is_json:
+                if req.data:
+                    post_data = req.json
+                    if not isinstance(post_data, dict):
+                        if len(func_kwargs) != 1:
+                            msg = ("If request payload is not a dict, "
+                                   f"there must be only one kwarg {type(post_data)}")
+                            raise UnprocessableEntity(msg)
+                        post_data = {next(iter(func_kwargs)): post_data}
+                    as_fun_params(post_data.items(), view_args, False)
+            elif req.is_multipart:
+                as_fun_params(req.form.lists(), view_args)
+                as_fun_params(req.files.lists(), view_args)
+            elif req.is_form_urlencoded:
+                as_fun_params(req.form.lists(), view_args, replace=False)
+            else:
+                as_fun_params(req.values.lists(), view_args, replace=False)
+        except Exception as e:
+            raise UnprocessableEntity(str(e))
+        return view_args
+
+    # Keyword arguments extractor per HTTP method
+    kwargs_extractors = {'GET': from_query, **{body_method: from_body for body_method in BODY_METHODS}}
+    route_extractor = kwargs_extractors.get(method) if method else None
 
     def proxy(**view_args):
         """
@@ -58,108 +142,50 @@ def create_cws_proxy(scaffold: "Scaffold", func, func_args: list[str], func_kwar
 
         :param view_args: Request path parameters.
         """
-
-        def check_keyword_expected(param_name):
-            """Alerts when more parameters than expected are defined in request."""
-            if func_kwargs and param_name not in func_kwargs:
-                _err_msg = f"TypeError: got an unexpected keyword argument '{param_name}'"
-                raise UnprocessableEntity(_err_msg)
-
-        def as_fun_params(values: dict, flat=True):
-            """Set parameters as simple value or list of values if multiple defined.
-           :param values: Dict of values.
-           :param flat: If true, the list values of lenth 1 is return as single value.
-            """
-            params: dict[str, t.Any] = {}
-            for k, v in values.items():
-                k = remove_brackets(k)
-
-                # if the parameter is a sparse fieldsets
-                if splitted := SQUARE_BRACKETED_KWARG_PATTERN.fullmatch(k):
-                    for kwarg in func_kwargs:
-                        if k.startswith(kwarg) and OPEN_SQUARE_BRACKETED_KWARG_PATTERN.fullmatch(kwarg):
-                            k = kwarg
-                            if k in params:
-                                v = {**params[k], **{splitted.group(2): v}}
-                            else:
-                                v = {splitted.group(2): v}
-                            break
-
-                try:
-                    check_keyword_expected(k)
-                except UnprocessableEntity:
-                    if not func_generic_kwargs:
-                        raise
-                params[k] = v
-
-            # Flatten single value
-            if flat:
-                params = {k: v[0] if isinstance(v, list) and len(v) == 1 else v for k, v in params.items()}
-
-            return params
+        # Dereferences the request local proxy only once
+        req = request._get_current_object()  # type: ignore[attr-defined]
 
         # Get keyword arguments from request parameters or body
         if func_kwargs or func_generic_kwargs:
-
-            # Adds parameters from query parameters
-            if request.method == 'GET':
-                get_data = request.values.to_dict(False)
-                view_args = dict(**view_args, **as_fun_params(get_data))
-
-            # Adds parameters from body
-            elif request.method in ['POST', 'PUT', 'PATCH', 'DELETE']:
-                try:
-                    if request.is_json:
-                        if request.data:
-                            post_data = request.json
-                            if not isinstance(post_data, dict):
-                                if len(func_kwargs) != 1:
-                                    msg = ("If request payload is not a dict, "
-                                           f"there must be only one kwarg {type(post_data)}")
-                                    raise UnprocessableEntity(msg)
-                                post_data = {next(iter(func_kwargs)): post_data}
-                            view_args = {**view_args, **as_fun_params(post_data, False)}
-                    elif request.is_multipart:
-                        post_data = request.form.to_dict(False)
-                        files = request.files.to_dict(False)
-                        view_args = {**view_args, **as_fun_params(post_data), **as_fun_params(files)}
-                    elif request.is_form_urlencoded:
-                        post_data = request.form.to_dict(False)
-                        view_args = dict(**view_args, **as_fun_params(post_data))
-                    else:
-                        post_data = request.values.to_dict(False)
-                        view_args = dict(**view_args, **as_fun_params(post_data))
-                except Exception as e:
-                    raise UnprocessableEntity(str(e))
-
-            else:
-                err_msg = f"Keyword arguments are not permitted for {request.method} method."
+            extractor = route_extractor or kwargs_extractors.get(req.method)
+            if extractor is None:
+                err_msg = f"Keyword arguments are not permitted for {req.method} method."
                 raise UnprocessableEntity(err_msg)
+            view_args = extractor(req, view_args)
 
         else:
             if not func_args:
-                try:
-                    if request.content_length:
-                        if request.is_json and request.json:
-                            err_msg = f"TypeError: got an unexpected arguments (body: {request.json})"
-                            raise UnprocessableEntity(err_msg)
-                    if request.query_string:
-                        err_msg = f"TypeError: got an unexpected arguments (query: {request.query_string!r})"
+
+                # Checks the query string before parsing the body
+                if req.query_string:
+                    err_msg = f"TypeError: got an unexpected arguments (query: {req.query_string!r})"
+                    raise UnprocessableEntity(err_msg)
+
+                # Only a non empty JSON body is rejected (lambda events always have a body)
+                if req.content_length and req.is_json:
+                    try:
+                        body = req.json
+                    except Exception as e:
+                        current_app.logger.error(f"Should not go here (1) : {str(e)}")
+                        current_app.logger.error(f"Should not go here (2) : {req.get_data()}")
+                        current_app.logger.error(f"Should not go here (3) : {view_args}")
+                        raise
+                    if body:
+                        err_msg = f"TypeError: got an unexpected arguments (body: {body})"
                         raise UnprocessableEntity(err_msg)
-                except Exception as e:
-                    current_app.logger.error(f"Should not go here (1) : {str(e)}")
-                    current_app.logger.error(f"Should not go here (2) : {request.get_data()}")
-                    current_app.logger.error(f"Should not go here (3) : {view_args}")
-                    raise
 
-        view_args = as_typed_kwargs(func, view_args)
+        view_args = as_typed_kwargs(func, view_args, casters)
         result = current_app.ensure_sync(func)(scaffold, **view_args)
 
-        resp = make_response(result) if result is not None else \
-            make_response("", 204, {'content-type': 'text/plain'})
+        # Plain string results don't need the flask response conversion
+        if isinstance(result, (str, bytes)):
+            resp = current_app.response_class(result)
+        elif result is not None:
+            resp = make_response(result)
+        else:
+            resp = make_response("", 204, {'content-type': 'text/plain'})
 
-        binary_headers = get_cws_annotations(func, "__CWS_BINARY_HEADERS")
-        if binary_headers and not request.in_lambda_context:
+        if binary_headers and not req.in_lambda_context:
             resp.headers.update(binary_headers)
 
         return resp
@@ -171,41 +197,41 @@ def path_join(*args: str) -> str:
     """ Joins given arguments into an entry route.
     Slashes are stripped for each argument.
     """
-
-    reduced = (x.lstrip('/').rstrip('/') for x in args if x)
-    return str(PurePosixPath('/').joinpath(*reduced))[1:]
+    return '/'.join(split_path(*args))
 
 
 def make_absolute(route: str, url_prefix: str) -> str:
     """Creates an absolute route.
     """
-    path = PurePosixPath('/')
-    if url_prefix:
-        path = path / url_prefix
-    if route:
-        path = path / route
-    return str(path)
+    segments: list[str] = []
+    for path in (url_prefix, route):
+        if path:
+            # as for path joining, an absolute path replaces the previous one
+            if path.startswith('/'):
+                segments = []
+            segments.extend(split_path(path))
+    return '/' + '/'.join(segments)
+
+
+def split_path(*args: str) -> list[str]:
+    """Splits the paths in segments (empty and current dir segments are removed as in a posix path)."""
+    return [segment for path in args if path for segment in path.split('/') if segment and segment != '.']
 
 
 def trim_underscores(name: str) -> str:
     """Removes starting and ending _ in name.
     """
-    if name:
-        while name.startswith('_'):
-            name = name[1:]
-        while name.endswith('_'):
-            name = name[:-1]
-    return name
+    return name.strip('_') if name else name
 
 
 def is_arg_parameter(param: Parameter) -> bool:
     """ Checks if the parameter is an arg (not a kwarg)."""
-    return param.default == inspect.Parameter.empty
+    return param.default is inspect.Parameter.empty
 
 
 def is_kwarg_parameter(param: Parameter) -> bool:
     """ Checks if the parameter is an arg (not a kwarg)."""
-    return param.default != inspect.Parameter.empty
+    return param.default is not inspect.Parameter.empty
 
 
 def remove_brackets(name):
@@ -214,59 +240,134 @@ def remove_brackets(name):
     return name.replace('[', '__').replace(']', '__')
 
 
-def as_typed_kwargs(func: t.Callable, kwargs: dict):
-    def get_typed_value(name: str, parameter_type, val):
-        if isinstance(parameter_type, types.UnionType):
-            for arg in t.get_args(parameter_type):
+def get_annotations(func: t.Callable) -> dict[str, t.Any]:
+    """Returns the function parameters annotations."""
+    return {name: param.annotation for name, param in signature(func).parameters.items()}
+
+
+def get_value_caster(name: str, parameter_type) -> t.Callable[[t.Any], t.Any] | None:
+    """Returns the function casting a request value to the parameter type (None if no cast is needed).
+
+    :param name: The parameter name.
+    :param parameter_type: The parameter annotation.
+    """
+    if not parameter_type or parameter_type is Signature.empty:
+        return None
+
+    if isinstance(parameter_type, types.UnionType):
+        none_type = type(None)
+        union_args = t.get_args(parameter_type)
+        nullable = none_type in union_args
+        casters = [get_value_caster(name, arg) or (lambda v: v) for arg in union_args if arg is not none_type]
+
+        # Optional value: no need to try each type
+        if nullable and len(casters) == 1:
+            caster = casters[0]
+
+            def cast_optional(val):
+                return None if val is None else caster(val)
+
+            return cast_optional
+
+        def cast_union(val):
+            if val is None and nullable:
+                return None
+            for caster in casters:
                 try:
-                    return get_typed_value(name, arg, val)
+                    return caster(val)
                 except (UnprocessableEntity, ValidationError):
                     raise
                 except (TypeError, ValueError):
                     pass
             raise TypeError()
-        origin = t.get_origin(parameter_type)
-        if origin is t.Union:
-            for arg in t.get_args(parameter_type):
-                return get_typed_value(name, arg, val)
-            raise TypeError()
-        if origin is list:
-            arg = t.get_args(parameter_type)[0]
-            if isinstance(val, list):
-                return [arg(v) for v in val]
-            return [arg(val)]
-        if origin is set:
-            arg = t.get_args(parameter_type)[0]
-            if isinstance(val, list):
-                return {arg(v) for v in val}
-            return {arg(val)}
-        if origin is None:
-            if not parameter_type or parameter_type is Signature.empty:
-                return val
+
+        return cast_union
+
+    origin = t.get_origin(parameter_type)
+    if origin is t.Union:
+        return get_value_caster(name, t.get_args(parameter_type)[0])
+    if origin is list or origin is set:
+        args = t.get_args(parameter_type)
+        if not args:
+            return None
+        arg, container = args[0], origin
+
+        def cast_collection(val):
             if isinstance(val, list):
-                msg = f"Multiple values for '{name}' query parameters are not allowed"
-                raise UnprocessableEntity(msg)
-            if issubclass(parameter_type, bool):
-                return str_to_bool(val)
-            if issubclass(parameter_type, dict):
-                if isinstance(val, str):
-                    return json.loads(val)
-            if issubclass(parameter_type, BaseModel):
-                return parameter_type(**json.loads(val))
-            return val if isinstance(val, parameter_type) else parameter_type(val)
-
-    typed_kwargs = {**kwargs}
+                return container(arg(v) for v in val)
+            return container((arg(val),))
+
+        return cast_collection
+    if origin is not None:
+        return None
+
+    cls: t.Any = parameter_type
+    if not isinstance(parameter_type, type):
+        cast = cls
+    elif issubclass(parameter_type, bool):
+        cast = str_to_bool
+    elif issubclass(parameter_type, BaseModel):
+        def cast(val):
+            return cls(**json.loads(val))
+    elif issubclass(parameter_type, dict):
+        def cast(val):
+            if isinstance(val, str):
+                return json.loads(val)
+            return val if isinstance(val, cls) else cls(val)
+    else:
+        def cast(val):
+            return val if isinstance(val, cls) else cls(val)
+
+    def cast_single(val):
+        if isinstance(val, list):
+            msg = f"Multiple values for '{name}' query parameters are not allowed"
+            raise UnprocessableEntity(msg)
+        return cast(val)
+
+    return cast_single
+
+
+def get_value_casters(annotations: dict[str, t.Any]) -> dict[str, t.Callable[[t.Any], t.Any]]:
+    """Returns the value casting functions for the annotated parameters."""
+    casters = {}
+    for name, parameter_type in annotations.items():
+        if caster := get_value_caster(name, parameter_type):
+            casters[name] = caster
+    return casters
+
+
+def as_typed_kwargs(func: t.Callable, kwargs: dict, casters: dict[str, t.Callable[[t.Any], t.Any]] | None = None):
+    """Casts the keyword arguments to the function parameters types.
+
+    :param func: The function called.
+    :param kwargs: The keyword arguments values.
+    :param casters: The parameters value casting functions (computed from signature if not given).
+    """
+    if not kwargs:
+        return kwargs
+
+    if casters is None:
+        casters = get_value_casters(get_annotations(func))
+    if not casters:
+        return kwargs
+
+    # The new dict is only created if a value is casted
+    typed_kwargs = None
     try:
-        parameters = signature(func).parameters
         for name, value in kwargs.items():
-            typed_kwargs[name] = get_typed_value(name, t.cast(Parameter, parameters.get(name)).annotation, value)
+            caster = casters.get(name)
+            if caster is None:
+                continue
+            if typed_kwargs is None:
+                typed_kwargs = {**kwargs}
+            typed_kwargs[name] = caster(value)
     except (UnprocessableEntity, ValidationError):
         raise
     except (TypeError, ValueError) as e:
         raise UnprocessableEntity(str(e))
     except (Exception,):
         pass
-    return typed_kwargs
+    return kwargs if typed_kwargs is None else typed_kwargs
 
 
 def is_json(mt):
@@ -281,7 +382,7 @@ def is_json(mt):
 
 
 def str_to_bool(val: str) -> bool:
-    return val.lower() in ['true', '1', 'yes']
+    return val.lower() in TRUE_VALUES
 
 
 def get_app_stage():
@@ -290,11 +391,26 @@ def get_app_stage():
 
 
 def load_dotenv(stage: str):
+    env_filenames = get_env_filenames(stage)
+
+    # Walks the parent directories once to find the nearest path of each file
+    paths: dict[str, str] = {}
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in env_filenames and entry.name not in paths and entry.is_file():
+                        paths[entry.name] = entry.path
+        except OSError:
+            continue
+        if len(paths) == len(env_filenames):
+            break
+
     values = {}
-    for env_filename in get_env_filenames(stage):
-        path = dotenv.find_dotenv(env_filename, usecwd=True)
-        if path:
-            values.update(dotenv.dotenv_values(path))
+    for env_filename in env_filenames:
+        if env_filename in paths:
+            values.update(dotenv.dotenv_values(paths[env_filename]))
     return values
 
 
@@ -333,6 +449,45 @@ def nr_url(path: str = '', query: dict | None = None, merge_query: bool = False)
     return urllib_urlunsplit([proto, host, path, qs, ''])
 
 
+def get_class_functions(klass: type) -> dict[str, types.FunctionType]:
+    """Returns the functions defined in the class or inherited (as resolved by the class attribute lookup)."""
+    functions: dict[str, types.FunctionType] = {}
+    for base in reversed(klass.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, staticmethod):
+                value = value.__func__
+            if isinstance(value, types.FunctionType):
+                functions[name] = value
+            else:
+                functions.pop(name, None)
+    return functions
+
+
+def get_class_entries(klass: type) -> tuple[tuple[types.FunctionType, dict[str, t.Any]], ...]:
+    """Returns the entry functions of the class with their CoWorks annotations (sorted by name).
+
+    The list is computed at the first registration of the class and stored on the class itself (own ``__dict__``
+    only, so each subclass has its own list). Entries added to the class after its first registration are not
+    seen; delete the ``_cws_entries`` class attribute to recompute them.
+    """
+    entries = klass.__dict__.get(CWS_ENTRIES_ATTRIBUTE)
+    if entries is None:
+        functions = ((fun, get_cws_attributes(fun)) for _, fun in sorted(get_class_functions(klass).items()))
+        entries = tuple((fun, cws_attributes) for fun, cws_attributes in functions if cws_attributes)
+        setattr(klass, CWS_ENTRIES_ATTRIBUTE, entries)
+    return entries
+
+
+def get_cws_attributes(func) -> dict[str, t.Any]:
+    """Returns all the CoWorks annotations of an entry function (empty if not an entry)."""
+    while func is not None:
+        attributes = getattr(func, '__dict__', {})
+        if attributes.get('__CWS_METHOD'):
+            return {k: v for k, v in attributes.items() if k.startswith('__CWS_')}
+        func = attributes.get('__wrapper__')
+    return {}
+
+
 def get_cws_annotations(func, key, default=None):
     """Entry function is at least annotated by __CWS_METHOD."""
     if getattr(func, '__CWS_METHOD', None):
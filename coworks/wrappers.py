@@ -175,7 +175,8 @@ class CoworksRequest(FlaskRequest):
             if kwargs.get('as_text', False):
                 self.__data = json.dumps(self.aws_body) if self._body_is_dict else self.aws_body
             elif self.aws_body:
-                self.__data = self.aws_body if self._body_is_dict else json.loads(self.aws_body)
+                # Shares the parsed body with get_json
+                self.__data = self.get_json()
         return self.__data
 
     def get_json(self, **kwargs):
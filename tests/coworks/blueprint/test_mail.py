@@ -10,8 +10,8 @@ from coworks import TechMicroService
 from coworks.blueprint.mail_blueprint import Mail
 
 smtp_mock = mock.MagicMock()
-smtp_mock.return_value.__enter__.return_value.login = login_mock = mock.Mock()
-smtp_mock.return_value.__enter__.return_value.send_message = send_mock = mock.Mock()
+smtp_mock.return_value.login = login_mock = mock.Mock()
+smtp_mock.return_value.send_message = send_mock = mock.Mock()
 
 email_mock = mock.MagicMock()
 email_mock.return_value.add_attachment = add_mock = mock.Mock()
@@ -91,6 +91,100 @@ class TestClass:
             login_mock.assert_called_with('myself@test.com', 'passwd')
             send_mock.assert_called_once()
 
+    @mock.patch.dict(os.environ, {
+        "SMTP_SERVER": "mail.test.com:587",
+        "SMTP_LOGIN": "myself@test.com",
+        "SMTP_PASSWD": "passwd"
+    })
+    def test_send_reuse_connection(self, auth_headers):
+        smtp = mock.MagicMock()
+        smtp.return_value.noop.return_value = (250, b"OK")
+        with mock.patch.object(smtplib, 'SMTP', smtp):
+            app = MailMS(env_var_prefix='SMTP')
+            with app.test_client() as c:
+                data = {
+                    'subject': "Test",
+                    'from_addr': "from@test.fr",
+                    'to_addrs': "to@test.fr",
+                }
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+        smtp.assert_called_once()
+        smtp.return_value.login.assert_called_once()
+        assert smtp.return_value.send_message.call_count == 2
+
+    @mock.patch.dict(os.environ, {
+        "SMTP_SERVER": "mail.test.com:587",
+        "SMTP_LOGIN": "myself@test.com",
+        "SMTP_PASSWD": "passwd"
+    })
+    def test_close_connection_at_exit(self):
+        smtp = mock.MagicMock()
+        with mock.patch.object(smtplib, 'SMTP', smtp), mock.patch('atexit.register') as register:
+            mail = Mail(env_var_prefix='SMTP')
+            register.assert_called_once_with(mail._close_smtp)
+            mail._get_smtp(True)
+            register.call_args.args[0]()
+        smtp.return_value.quit.assert_called_once()
+        assert mail._smtp is None
+
+    @mock.patch.dict(os.environ, {
+        "SMTP_SERVER": "mail.test.com:587",
+        "SMTP_LOGIN": "myself@test.com",
+        "SMTP_PASSWD": "passwd"
+    })
+    def test_send_reconnect_on_421(self, auth_headers):
+        smtp = mock.MagicMock()
+        smtp.return_value.noop.return_value = (250, b"OK")
+        with mock.patch.object(smtplib, 'SMTP', smtp):
+            app = MailMS(env_var_prefix='SMTP')
+            with app.test_client() as c:
+                data = {
+                    'subject': "Test",
+                    'from_addr': "from@test.fr",
+                    'to_addrs': "to@test.fr",
+                }
+
+                # a new connection is not retried
+                refused = smtplib.SMTPSenderRefused(421, b"Timeout", "from@test.fr")
+                smtp.return_value.send_message.side_effect = refused
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 500
+                assert smtp.call_count == 1
+                assert smtp.return_value.send_message.call_count == 1
+
+                # the kept connection is closing when sending
+                smtp.return_value.send_message.side_effect = None
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+                smtp.return_value.send_message.side_effect = [refused, None]
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+                assert smtp.call_count == 2
+                assert smtp.return_value.send_message.call_count == 4
+
+                # the kept connection is no more valid after an idle timeout
+                smtp.return_value.send_message.side_effect = None
+                smtp.return_value.noop.return_value = (421, b"Timeout")
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+                assert smtp.call_count == 3
+                assert smtp.return_value.send_message.call_count == 5
+
+                # a disconnection while sending is not retried as the message may have been accepted
+                smtp.return_value.noop.return_value = (250, b"OK")
+                disconnected = smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+                smtp.return_value.send_message.side_effect = disconnected
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 500
+                assert smtp.call_count == 3
+                assert smtp.return_value.send_message.call_count == 6
+                smtp.return_value.send_message.side_effect = None
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 200
+                assert smtp.call_count == 4
+
+                # other errors are not retried
+                smtp.return_value.noop.return_value = (250, b"OK")
+                refused = smtplib.SMTPSenderRefused(550, b"Refused", "from@test.fr")
+                smtp.return_value.send_message.side_effect = refused
+                assert c.post('/send', data=data, headers=auth_headers).status_code == 500
+                assert smtp.call_count == 4
+
     @mock.patch.dict(os.environ, {
         "SMTP_SERVER": "mail.test.com:587",
         "SMTP_LOGIN": "myself@test.com",
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import xmlrpc.client
+from unittest import mock
+
+import pytest
+import requests
+
+from coworks.extension.odoo import Odoo
+from coworks.extension.odoo import OdooConfig
+
+
+def get_odoo():
+    config = OdooConfig(url="http://odoo", dbname="db", user="user", passwd="passwd")
+    other = OdooConfig(url="http://other", dbname="db", user="user", passwd="passwd")
+    return Odoo(config=config, binds={'other': other})
+
+
+def server_proxy(url):
+    proxy = mock.MagicMock(url=url)
+    proxy.authenticate.return_value = 1
+    return proxy
+
+
+def jsonrpc_response(content, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(content).encode()
+    return response
+
+
+class TestClass:
+
+    @mock.patch('xmlrpc.client.ServerProxy', side_effect=server_proxy)
+    def test_xmlrpc_proxies(self, proxy_mock):
+        odoo = get_odoo()
+
+        odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+        odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+        object_urls = [c.args[0] for c in proxy_mock.call_args_list if c.args[0].endswith('/object')]
+        assert object_urls == ["http://odoo/xmlrpc/2/object"]
+        models = odoo._local.models[None]
+        assert models.execute_kw.call_count == 2
+        models.execute_kw.assert_called_with("db", 1, "passwd", "res.partner", "search_count", [[]])
+
+        # Another bind has its own proxy
+        odoo.odoo_execute_kw("res.partner", "search_count", [[]], bind_key='other')
+        assert odoo._local.models['other'] is not models
+        assert odoo._local.models['other'].url == "http://other/xmlrpc/2/object"
+
+        # Another thread has its own proxies
+        thread_models = []
+
+        def execute():
+            odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+            thread_models.append(odoo._local.models[None])
+
+        thread = threading.Thread(target=execute)
+        thread.start()
+        thread.join()
+        assert len(thread_models) == 1
+        assert thread_models[0] is not models
+        assert odoo._local.models[None] is models
+
+    def test_get_models(self):
+        odoo = get_odoo()
+        with mock.patch.object(odoo, 'odoo_execute_kw', return_value=[{'id': 1}]) as execute_kw:
+            assert odoo.get_models("res.partner", "ref", ['a', 'b']) == [{'id': 1}]
+            execute_kw.assert_called_once_with("res.partner", "search_read", [[('ref', 'in', ['a', 'b'])]], {},
+                                               bind_key=None)
+
+            execute_kw.reset_mock()
+            odoo.get_models("res.partner", "id", (i for i in range(3)), fields=['name'], bind_key='other')
+            execute_kw.assert_called_once_with("res.partner", "search_read", [[('id', 'in', [0, 1, 2])]],
+                                               {'fields': ['name']}, bind_key='other')
+
+    @mock.patch.dict(os.environ, {"ODOO_TRANSPORT": "jsonrpc"})
+    @mock.patch('requests.Session.post')
+    def test_jsonrpc(self, post_mock):
+        post_mock.side_effect = [jsonrpc_response({'result': 7}), jsonrpc_response({'result': 3}),
+                                 jsonrpc_response({'result': 4})]
+        odoo = get_odoo()
+        assert odoo.jsonrpc
+
+        assert odoo.odoo_execute_kw("res.partner", "search_count", [[('id', '>', 0)]]) == 3
+        assert post_mock.call_count == 2
+        post_mock.assert_any_call("http://odoo/jsonrpc", json={
+            'jsonrpc': "2.0",
+            'method': "call",
+            'params': {'service': 'common', 'method': 'authenticate', 'args': ["db", "user", "passwd", {}]},
+        }, timeout=Odoo.TIMEOUT)
+        post_mock.assert_called_with("http://odoo/jsonrpc", json={
+            'jsonrpc': "2.0",
+            'method': "call",
+            'params': {'service': 'object', 'method': 'execute_kw',
+                       'args': ["db", 7, "passwd", "res.partner", "search_count", [[('id', '>', 0)]]]},
+        }, timeout=Odoo.TIMEOUT)
+
+        # The uid is cached
+        assert odoo.odoo_execute_kw("res.partner", "search_count", [[]]) == 4
+        assert post_mock.call_count == 3
+        assert post_mock.call_args.kwargs['json']['params']['args'][:2] == ["db", 7]
+
+    @mock.patch.dict(os.environ, {"ODOO_TRANSPORT": "jsonrpc"})
+    @mock.patch('requests.Session.post')
+    def test_jsonrpc_errors(self, post_mock):
+        odoo = get_odoo()
+        odoo.binds[None].const['__uid'] = 7
+
+        post_mock.return_value = jsonrpc_response({'error': {'code': 200, 'message': "Odoo Server Error",
+                                                             'data': {'message': "Invalid field"}}})
+        with pytest.raises(xmlrpc.client.Fault) as exc_info:
+            odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+        assert exc_info.value.faultCode == 200
+        assert exc_info.value.faultString == "Invalid field"
+
+        post_mock.return_value = jsonrpc_response({'error': {'code': 100, 'message': "Odoo Session Expired"}})
+        with pytest.raises(xmlrpc.client.Fault) as exc_info:
+            odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+        assert exc_info.value.faultCode == 100
+        assert exc_info.value.faultString == "Odoo Session Expired"
+
+        post_mock.return_value = jsonrpc_response({}, status_code=502)
+        with pytest.raises(requests.HTTPError):
+            odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+
+    @mock.patch.dict(os.environ, {"ODOO_TRANSPORT": "jsonrpc"})
+    @mock.patch('requests.Session.post')
+    def test_jsonrpc_authentication_failed(self, post_mock):
+        post_mock.return_value = jsonrpc_response({'result': False})
+        odoo = get_odoo()
+        with pytest.raises(ConnectionError):
+            odoo.odoo_execute_kw("res.partner", "search_count", [[]])
+        assert '__uid' not in odoo.binds[None].const
@@ -0,0 +1,92 @@
+import datetime as dt
+from decimal import Decimal
+
+import pytest
+from flask import json
+from flask import jsonify
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+from coworks import TechMicroService
+from coworks import entry
+from coworks.extension.orjson_provider import Orjson
+from coworks.extension.orjson_provider import OrjsonProvider
+
+
+class OrjsonMS(TechMicroService):
+
+    def __init__(self):
+        super().__init__('orjson')
+        Orjson(self)
+
+    def _check_token(self):
+        return True
+
+    @entry
+    def get(self):
+        return jsonify({'b': 1, 'a': 'é', 'big': 2 ** 70})
+
+    @entry
+    def post(self, **kwargs):
+        return jsonify(request.json)
+
+
+class TestClass:
+
+    def test_provider(self):
+        app = OrjsonMS()
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_jsonify(self):
+        app = OrjsonMS()
+        with app.test_client() as c:
+            response = c.get('/')
+            assert response.status_code == 200
+            assert response.is_json
+            assert response.get_data(as_text=True).strip() == '{"b":1,"a":"é","big":1180591620717411303424}'
+            assert response.json == {'b': 1, 'a': 'é', 'big': 2 ** 70}
+
+    def test_request_json(self):
+        app = OrjsonMS()
+        data = {'z': [1, 2.5, None, True], 'a': {'nested': 'ü'}}
+        with app.test_client() as c:
+            response = c.post('/', json=data)
+            assert response.status_code == 200
+            assert response.json == data
+            assert list(response.json) == ['z', 'a']
+
+    def test_same_values_as_flask(self):
+        app = OrjsonMS()
+        values = {
+            'date': dt.date(2022, 1, 2),
+            'datetime': dt.datetime(2022, 1, 2, 3, 4, 5),
+            'decimal': Decimal('1.5'),
+        }
+        with app.app_context():
+            assert json.loads(json.dumps(values)) == json.loads(DefaultJSONProvider(app).dumps(values))
+
+    def test_key_ordering(self):
+        app = OrjsonMS()
+        with app.app_context():
+            assert json.dumps({1: 'a', 'b': 2}) == '{"1":"a","b":2}'
+            assert json.dumps({'b': 1, 'a': 2}) == '{"b":1,"a":2}'
+            app.json.sort_keys = True
+            assert json.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+            assert json.dumps({'b': 2, 1: 'a'}) == '{"1":"a","b":2}'
+
+    def test_non_ascii(self):
+        app = OrjsonMS()
+        with app.app_context():
+            assert json.dumps('é') == '"é"'
+            assert json.dumps('é', ensure_ascii=True) == '"\\u00e9"'
+            app.json.ensure_ascii = True
+            assert json.dumps('é') == '"\\u00e9"'
+
+    def test_fallback(self):
+        app = OrjsonMS()
+        with app.app_context():
+            assert json.dumps(2 ** 70) == str(2 ** 70)
+            assert json.dumps([2 ** 70, 'é']) == '[1180591620717411303424, "é"]'
+            with pytest.raises(TypeError):
+                json.dumps(object())
+            assert json.loads('{"a": 1}', parse_float=Decimal) == {'a': 1}
@@ -0,0 +1,36 @@
+from coworks.extension.jsonapi import CursorPagination
+
+
+class TestClass:
+
+    def test_pages(self):
+        pagination = CursorPagination(total=0, per_page=None, page=None)
+        assert pagination.pages == 1
+        assert pagination.page == 1
+        assert not pagination.has_prev
+        assert not pagination.has_next
+
+        pagination = CursorPagination(total=1000, per_page=10, page=1)
+        assert pagination.pages == 100
+        assert pagination.has_next
+        assert pagination.next_num == 2
+
+    def test_pages_after_assignment(self):
+        pagination = CursorPagination(total=1000, per_page=10, page=1)
+        assert pagination.pages == 100
+        pagination.total = 5
+        assert pagination.pages == 1
+        assert not pagination.has_next
+        assert pagination.next_num is None
+        pagination.total = 50
+        pagination.per_page = 20
+        assert pagination.pages == 3
+
+    def test_pages_after_copy(self):
+        pagination = CursorPagination(total=1000, per_page=10, page=1)
+        assert pagination.pages == 100
+        copy = pagination.model_copy(update={'total': 5})
+        assert copy.pages == 1
+        assert not copy.has_next
+        assert copy.next_num is None
+        assert pagination.pages == 100
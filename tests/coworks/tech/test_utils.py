@@ -0,0 +1,71 @@
+from coworks import TechMicroService
+from coworks import entry
+from coworks.utils import CWS_ENTRIES_ATTRIBUTE
+from coworks.utils import get_class_entries
+from coworks.utils import get_value_caster
+from coworks.utils import make_absolute
+from coworks.utils import path_join
+from coworks.utils import trim_underscores
+
+
+class EntriesMS(TechMicroService):
+
+    @entry
+    def get(self):
+        return "get"
+
+    def not_an_entry(self):
+        return "none"
+
+
+class ExtendedEntriesMS(EntriesMS):
+
+    @entry
+    def post(self):
+        return "post"
+
+
+class TestClass:
+
+    def test_path_join(self):
+        assert path_join() == ''
+        assert path_join('') == ''
+        assert path_join('/') == ''
+        assert path_join('a') == 'a'
+        assert path_join('/a/', 'b/') == 'a/b'
+        assert path_join('a', '', '/', 'b') == 'a/b'
+        assert path_join('a', '/<arg>') == 'a/<arg>'
+        assert path_join('a//b', './c') == 'a/b/c'
+
+    def test_make_absolute(self):
+        assert make_absolute('', '') == '/'
+        assert make_absolute('a', '') == '/a'
+        assert make_absolute('a/', 'prefix') == '/prefix/a'
+        assert make_absolute('a/<arg>', '/prefix/') == '/prefix/a/<arg>'
+        assert make_absolute('/a', 'prefix') == '/a'
+
+    def test_trim_underscores(self):
+        assert trim_underscores('') == ''
+        assert trim_underscores('___') == ''
+        assert trim_underscores('_get_') == 'get'
+        assert trim_underscores('__get__content__') == 'get__content'
+
+    def test_optional_value_caster(self):
+        caster = get_value_caster('i', int | None)
+        assert caster('3') == 3
+        assert caster(None) is None
+        caster = get_value_caster('i', int | str | None)
+        assert caster('3') == 3
+        assert caster('a') == 'a'
+        assert caster(None) is None
+
+    def test_class_entries(self):
+        entries = get_class_entries(EntriesMS)
+        assert [fun.__name__ for fun, _ in entries] == ['get']
+        assert EntriesMS.__dict__[CWS_ENTRIES_ATTRIBUTE] is entries
+        assert get_class_entries(EntriesMS) is entries
+
+        # Subclasses have their own entries
+        extended_entries = get_class_entries(ExtendedEntriesMS)
+        assert [fun.__name__ for fun, _ in extended_entries] == ['get', 'post']
+        assert get_class_entries(EntriesMS) is entries
@@ -1,9 +1,13 @@
 import os
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import PosixPath
 from unittest import mock
 
 import boto3
+import pytest
 from flask.cli import ScriptInfo
 
 from coworks import Blueprint
@@ -13,6 +17,7 @@ from coworks.cws.client import CwsScriptInfo
 from coworks.cws.deploy import Terraform
 from coworks.cws.deploy import TerraformBackend
 from coworks.cws.deploy import TerraformContext
+from coworks.cws.deploy import TerraformResource
 
 
 class CliCtxMokup:
@@ -71,10 +76,17 @@ class TestClass:
         assert len(api_ressources['img'].rules) == 1
         assert api_ressources['img'].rules[0].cws_binary_headers
         assert api_ressources['img'].rules[0].cws_no_auth
-        assert api_ressources['test'].rules is None
+        assert not api_ressources['test'].rules
         assert api_ressources['test_index'].rules is not None
         assert len(api_ressources['test_index'].rules) == 1
-        assert api_ressources['extended'].rules is None
+        assert not api_ressources['extended'].rules
+
+    def test_long_resource_uid(self):
+        parent_uid = '_'.join(['long'] * 20)
+        resource = TerraformResource(parent_uid=parent_uid, path='last')
+        assert resource.uid == TerraformResource(parent_uid=parent_uid, path='last').uid
+        assert len(resource.uid) < 80
+        assert resource.uid.endswith('_last')
 
     @mock.patch.dict(os.environ, {"test": "local", "FLASK_RUN_FROM_CLI": "true"})
     def test_deploy_ressources(self, example_dir, progressbar, capsys):
@@ -98,6 +110,47 @@ class TestClass:
         ter_resource = api_ressources['value_index']
         assert len(ter_resource.rules) == 2
 
+    def test_execute_timeout(self, monkeypatch, example_dir, tmp_path):
+        fake_terraform = tmp_path / "terraform"
+        fake_terraform.write_text("#!/bin/sh\necho started\nsleep 30\n")
+        fake_terraform.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setattr(Terraform, "TIMEOUT", 1)
+
+        info = CwsScriptInfo(project_dir='.')
+        info.app_import_path = "command:app"
+        app = info.load_app()
+        with app.test_request_context():
+            info = ScriptInfo(create_app=lambda: app)
+            terraform_context = TerraformContext(info, CliCtxMokup(stage='dev'))
+            backend = TerraformBackend(terraform_context, None, terraform_dir=".", terraform_refresh=False)
+            terraform = Terraform(backend, terraform_dir=tmp_path, workspace="common")
+            start = time.monotonic()
+            with pytest.raises(subprocess.TimeoutExpired) as pytest_wrapped_e:
+                terraform.init()
+        assert time.monotonic() - start < 10
+        assert pytest_wrapped_e.value.output == "started\n"
+
+    def test_execute_bar_main_thread(self, monkeypatch, example_dir, tmp_path, progressbar):
+        fake_terraform = tmp_path / "terraform"
+        fake_terraform.write_text("#!/bin/sh\necho one\necho two\necho three\n")
+        fake_terraform.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        threads = []
+        progressbar.advance.side_effect = lambda: threads.append(threading.current_thread())
+
+        info = CwsScriptInfo(project_dir='.')
+        info.app_import_path = "command:app"
+        app = info.load_app()
+        with app.test_request_context():
+            info = ScriptInfo(create_app=lambda: app)
+            terraform_context = TerraformContext(info, CliCtxMokup(stage='dev'))
+            backend = TerraformBackend(terraform_context, progressbar, terraform_dir=".", terraform_refresh=False)
+            terraform = Terraform(backend, terraform_dir=tmp_path, workspace="common")
+            process = terraform._execute(["init", "-input=false"])
+        assert process.stdout == "one\ntwo\nthree\n"
+        assert threads == [threading.main_thread()] * 3
+
     @mock.patch.dict(os.environ, {"test": "local", "FLASK_RUN_FROM_CLI": "true"})
     def test_deploy_local_cmd(self, monkeypatch, example_dir, progressbar, capsys):
         info = CwsScriptInfo(project_dir='.')